@@ -0,0 +1,26 @@
+# ============================================================================ #
+# Copyright (c) 2022 - 2024 NVIDIA Corporation & Affiliates.                   #
+# All rights reserved.                                                         #
+#                                                                              #
+# This source code and the accompanying materials are made available under     #
+# the terms of the Apache License 2.0 which accompanies this distribution.     #
+# ============================================================================ #
+
+import pytest, socket
+
+
+def _free_port():
+    # Let the OS pick a free port for a mock server. Bind all
+    # interfaces, as the mock servers do.
+    s = socket.socket()
+    s.bind(("", 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+
+@pytest.fixture(scope="session")
+def free_port():
+    # Each mock server asks for its own port, so that servers for
+    # different backends (and concurrent test sessions) do not collide.
+    return _free_port
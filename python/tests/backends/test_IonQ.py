@@ -6,7 +6,7 @@
 # the terms of the Apache License 2.0 which accompanies this distribution.     #
 # ============================================================================ #
 
-import cudaq, pytest, os, time
+import cudaq, pytest, os, socket, time
 from cudaq import spin
 from multiprocessing import Process
 try:
@@ -15,25 +15,46 @@ except:
     print("Mock qpu not available, skipping IonQ tests.")
     pytest.skip("Mock qpu not available.", allow_module_level=True)
 
-# Define the port for the mock server
-port = 62441
-
 
 def assert_close(got) -> bool:
     return got < -1.5 and got > -1.9
 
 
+@pytest.fixture(scope="session")
+def mock_port(free_port):
+    # Defined per module so the IonQ mock server gets its own port
+    return free_port()
+
+
 @pytest.fixture(scope="session", autouse=True)
-def startUpMockServer():
+def startUpMockServer(mock_port):
     os.environ["IONQ_API_KEY"] = "00000000000000000000000000000000"
 
     # Set the targeted QPU
-    cudaq.set_target("ionq", url="http://localhost:{}".format(port))
+    cudaq.set_target("ionq", url="http://localhost:{}".format(mock_port))
 
     # Launch the Mock Server
-    p = Process(target=startServer, args=(port,))
+    p = Process(target=startServer, args=(mock_port,))
     p.start()
-    time.sleep(1)
+
+    # Wait until the server accepts connections, rather than
+    # sleeping for a fixed amount of time
+    ready = False
+    deadline = time.time() + 2.0
+    while not ready and time.time() < deadline and p.is_alive():
+        try:
+            socket.create_connection(("localhost", mock_port),
+                                     timeout=0.05).close()
+            ready = True
+        except OSError:
+            time.sleep(0.02)
+
+    # Something accepting connections on the port is not enough, our own
+    # server must still be running (it exits if it failed to bind)
+    if not ready or not p.is_alive():
+        p.terminate()
+        pytest.fail(
+            "IonQ mock server did not start on port {}.".format(mock_port))
 
     yield "Server started."
 
@@ -42,10 +63,10 @@ def startUpMockServer():
 
 
 @pytest.fixture(scope="function", autouse=True)
-def configureTarget():
+def configureTarget(mock_port):
 
     # Set the targeted QPU
-    cudaq.set_target("ionq", url="http://localhost:{}".format(port))
+    cudaq.set_target("ionq", url="http://localhost:{}".format(mock_port))
     yield "Running the test."
     cudaq.reset_target()
 
@@ -59,34 +80,26 @@ def test_ionq_sample():
     kernel.mz(qubits)
     print(kernel)
 
-    # Run sample synchronously, this is fine
-    # here in testing since we are targeting a mock
-    # server. In reality you'd probably not want to
-    # do this with the remote job queue.
-    counts = cudaq.sample(kernel)
-    assert len(counts) == 2
-    assert "00" in counts
-    assert "11" in counts
+    # Launch all of the jobs asynchronously up-front. Each job is
+    # submitted to the remote IonQ job queue in turn, and we only
+    # wait on the results once all of them have been submitted.
+    f1, f2, f3 = [cudaq.sample_async(kernel) for _ in range(3)]
 
-    # Run sample, but do so asynchronously. This enters
-    # the execution job into the remote IonQ job queue.
-    future = cudaq.sample_async(kernel)
     # We could go do other work, but since this
     # is a mock server, get the result
-    counts = future.get()
+    counts = f1.get()
     assert len(counts) == 2
     assert "00" in counts
     assert "11" in counts
 
-    # Ok now this is the most likely scenario, launch the
-    # job asynchronously, this puts it in the queue, now
-    # you can take the future and persist it to file for later.
-    future = cudaq.sample_async(kernel)
-    print(future)
+    # Ok now this is the most likely scenario, the job is in
+    # the queue, now you can take the future and persist it
+    # to file for later.
+    print(f2)
 
     # Persist the future to a file (or here a string,
     # could write this string to file for later)
-    futureAsString = str(future)
+    futureAsString = str(f2)
 
     # Later you can come back and read it in and get
     # the results, which are now present because the job
@@ -97,6 +110,11 @@ def test_ionq_sample():
     assert "00" in counts
     assert "11" in counts
 
+    counts = f3.get()
+    assert len(counts) == 2
+    assert "00" in counts
+    assert "11" in counts
+
 
 def test_ionq_observe():
     # Create the parameterized ansatz
@@ -115,24 +133,25 @@ def test_ionq_observe():
     res = cudaq.observe(kernel, hamiltonian, 0.59)
     assert assert_close(res.expectation())
 
-    # Launch it asynchronously, enters the job into the queue
+    # Launch the observe job asynchronously, it enters the queue
     future = cudaq.observe_async(kernel, hamiltonian, 0.59)
-    # Retrieve the results (since we're on a mock server)
-    res = future.get()
-    assert assert_close(res.expectation())
 
-    # Launch the job async, job goes in the queue, and
-    # we're free to dump the future to file
-    future = cudaq.observe_async(kernel, hamiltonian, 0.59)
+    # We're free to dump the future to file
     print(future)
     futureAsString = str(future)
 
-    # Later you can come back and read it in
+    # Retrieve the results (since we're on a mock server)
+    res = future.get()
+    assert assert_close(res.expectation())
+
+    # Later you can come back and read it in, as many times as
+    # needed, without submitting the job again.
     # You must provide the spin_op so we can reconstruct
     # the results from the term job ids.
-    futureReadIn = cudaq.AsyncObserveResult(futureAsString, hamiltonian)
-    res = futureReadIn.get()
-    assert assert_close(res.expectation())
+    for _ in range(2):
+        futureReadIn = cudaq.AsyncObserveResult(futureAsString, hamiltonian)
+        res = futureReadIn.get()
+        assert assert_close(res.expectation())
 
 
 def test_ionq_u3_decomposition():
@@ -15,45 +15,46 @@ except:
     print("Mock qpu not available, skipping Quantinuum tests.")
     pytest.skip("Mock qpu not available.", allow_module_level=True)
 
-# Define the port for the mock server
-port = 62440
-
 
 def assert_close(got) -> bool:
     return got < -1.5 and got > -1.9
 
 
+@pytest.fixture(scope="session")
+def mock_port(free_port):
+    # Defined per module so this Quantinuum mock server gets its own port
+    return free_port()
+
+
 @pytest.fixture(scope="session", autouse=True)
-def startUpMockServer():
+def startUpMockServer(tmp_path_factory, mock_port):
     # We need a Fake Credentials Config file
-    credsName = '{}/QuantinuumFakeConfig.config'.format(os.environ["HOME"])
-    f = open(credsName, 'w')
-    f.write('key: {}\nrefresh: {}\ntime: 0'.format("hello", "rtoken"))
-    f.close()
+    credsName = tmp_path_factory.mktemp("quantinuum") / "FakeConfig.config"
+    credsName.write_text('key: {}\nrefresh: {}\ntime: 0'.format(
+        "hello", "rtoken"))
 
     cudaq.set_random_seed(13)
 
     # Set the targeted QPU
-    cudaq.set_target('quantinuum', url='http://localhost:{}'.format(port))
+    cudaq.set_target('quantinuum', url='http://localhost:{}'.format(mock_port))
 
     # Launch the Mock Server
-    p = Process(target=startServer, args=(port,))
+    p = Process(target=startServer, args=(mock_port,))
     p.start()
     time.sleep(1)
 
-    yield credsName
+    yield str(credsName)
 
-    # Kill the server, remove the file
+    # Kill the server
     p.terminate()
-    os.remove(credsName)
 
 
 @pytest.fixture(scope="function", autouse=True)
-def configureTarget(startUpMockServer):
+def configureTarget(startUpMockServer, mock_port):
 
     # Set the targeted QPU with credentials
     cudaq.set_target('quantinuum',
-                     url='http://localhost:{}'.format(port),
+                     url='http://localhost:{}'.format(mock_port),
                      credentials=startUpMockServer)
 
     yield "Running the test."